@@ -1,28 +1,21 @@
 """LLM inference with llama-cpp-python - GPU with CPU fallback."""
 import os
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import AsyncGenerator, TYPE_CHECKING
 import logging
 import asyncio
+import threading
 
-try:
+if TYPE_CHECKING:
     from llama_cpp import Llama
-    LLAMA_CPP_AVAILABLE = True
-    
-    # Try to detect CUDA availability
-    try:
-        import llama_cpp
-        if hasattr(llama_cpp, '__version__'):
-            logger_init = logging.getLogger(__name__)
-            logger_init.info(f"llama-cpp-python version: {llama_cpp.__version__}")
-    except Exception as e:
-        pass
-        
-except ImportError:
-    LLAMA_CPP_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# llama-cpp-python loads its native library on import, so defer it until first use
+_llama_class = None
+_llama_import_attempted = False
+_llama_import_lock = threading.Lock()
+
 # Get models directory
 MODELS_DIR = Path(os.getenv("MODELS_DIR", "../models"))
 
@@ -30,6 +23,22 @@ MODELS_DIR = Path(os.getenv("MODELS_DIR", "../models"))
 _loaded_models: dict[str, "Llama"] = {}
 
 
+def llama_cpp_available() -> bool:
+    """Import llama-cpp-python on first call and report whether it is installed."""
+    global _llama_class, _llama_import_attempted
+    with _llama_import_lock:
+        if not _llama_import_attempted:
+            _llama_import_attempted = True
+            try:
+                import llama_cpp
+                _llama_class = llama_cpp.Llama
+                if hasattr(llama_cpp, '__version__'):
+                    logger.info(f"llama-cpp-python version: {llama_cpp.__version__}")
+            except ImportError:
+                logger.info("llama-cpp-python is not installed")
+    return _llama_class is not None
+
+
 def get_model_path(model_id: str) -> Path:
     """Get the full path to a model file."""
     return MODELS_DIR / model_id
@@ -47,7 +56,7 @@ def load_model(model_id: str, n_ctx: int = 4096, n_gpu_layers: int = -1) -> "Lla
     Returns:
         Loaded Llama model instance
     """
-    if not LLAMA_CPP_AVAILABLE:
+    if not llama_cpp_available():
         raise RuntimeError("llama-cpp-python is not installed. Cannot load model.")
     
     if model_id in _loaded_models:
@@ -64,7 +73,7 @@ def load_model(model_id: str, n_ctx: int = 4096, n_gpu_layers: int = -1) -> "Lla
     
     try:
         # Try loading with GPU support first (n_gpu_layers=-1 uses all available GPU)
-        model = Llama(
+        model = _llama_class(
             model_path=str(model_path),
             n_ctx=n_ctx,
             n_gpu_layers=n_gpu_layers,
@@ -76,7 +85,7 @@ def load_model(model_id: str, n_ctx: int = 4096, n_gpu_layers: int = -1) -> "Lla
         logger.info(f"Falling back to CPU-only mode")
         try:
             # Fallback to CPU only
-            model = Llama(
+            model = _llama_class(
                 model_path=str(model_path),
                 n_ctx=n_ctx,
                 n_gpu_layers=0,  # CPU only
@@ -128,7 +137,8 @@ async def generate_streaming(
     Yields:
         Generated tokens as they're produced
     """
-    if not LLAMA_CPP_AVAILABLE:
+    # The first call loads the native library; keep it off the event loop
+    if not await asyncio.to_thread(llama_cpp_available):
         error_msg = "llama-cpp-python is not installed. Cannot generate responses."
         logger.error(error_msg)
         yield error_msg
@@ -0,0 +1,103 @@
+"""Backend registry - maps model IDs to inference backends, imported lazily."""
+import asyncio
+import importlib
+import logging
+import time
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Backend:
+    """An inference backend, referenced by module path so it is only imported when needed."""
+    name: str
+    module: str
+    generate: str  # Streaming generator taking the model name as first argument
+    prefix: Optional[str] = None  # Model ID prefix; None matches file paths (the default backend)
+    check: Optional[str] = None  # Async availability check, run before generating
+    unavailable_message: str = ""
+    warmup: Optional[str] = None  # Called on background preload to pull in heavy dependencies
+
+
+BACKENDS: list[Backend] = [
+    Backend(
+        name="ollama",
+        module="app.llm.ollama_inference",
+        generate="generate_streaming_ollama",
+        prefix="ollama:",
+        check="check_ollama_available",
+        unavailable_message="Ollama is not running. Please start Ollama.",
+    ),
+    Backend(
+        name="llama-cpp",
+        module="app.llm.inference",
+        generate="generate_streaming",
+        warmup="llama_cpp_available",
+    ),
+]
+
+
+def get_backend(name: str) -> Backend:
+    """Get a registered backend by name."""
+    for backend in BACKENDS:
+        if backend.name == name:
+            return backend
+    raise KeyError(f"Unknown backend: {name}")
+
+
+def resolve_backend(model_id: str) -> tuple[Backend, str]:
+    """
+    Resolve a model ID to its backend.
+
+    Args:
+        model_id: Model ID, e.g. "ollama:llama3.1:8b" or "small/model.gguf"
+
+    Returns:
+        Tuple of (backend, model name with the backend prefix stripped)
+    """
+    default = None
+    for backend in BACKENDS:
+        if backend.prefix is None:
+            default = default or backend
+        elif model_id.startswith(backend.prefix):
+            return backend, model_id[len(backend.prefix):]
+    if default is None:
+        raise KeyError(f"No backend registered for model: {model_id}")
+    return default, model_id
+
+
+def load_backend(backend: Backend) -> ModuleType:
+    """Import a backend module on first use."""
+    start = time.perf_counter()
+    module = importlib.import_module(backend.module)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if elapsed_ms >= 1:
+        logger.info(f"Imported backend {backend.name} in {elapsed_ms:.1f} ms")
+    return module
+
+
+def preload_backend(backend: Backend) -> None:
+    """Import a backend and run its warmup hook, so the first request doesn't pay for it."""
+    start = time.perf_counter()
+    module = load_backend(backend)
+    if backend.warmup:
+        getattr(module, backend.warmup)()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.info(f"Preloaded backend {backend.name} in {elapsed_ms:.1f} ms")
+
+
+async def preload_backends(names: list[str]) -> None:
+    """
+    Preload backends in a worker thread after startup.
+
+    Args:
+        names: Backend names to preload, e.g. ["llama-cpp"]
+    """
+    for name in names:
+        try:
+            await asyncio.to_thread(preload_backend, get_backend(name))
+        except Exception as e:
+            logger.warning(f"Failed to preload backend {name}: {e}")
@@ -1,11 +1,19 @@
 """FastAPI application entry point."""
+import asyncio
 import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 import os
 
-from app.routers import chat, models, conversations
+from app.startup import profile_step, report_startup
+
+with profile_step("import fastapi"):
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+
+with profile_step("import app.routers"):
+    from app.routers import chat, models, conversations
+
+from app.llm.registry import preload_backends
 
 # Configure logging
 logging.basicConfig(
@@ -19,9 +27,15 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     logger.info("Starting Monolith backend...")
-    # TODO: Initialize LLM engine on startup
     # TODO: Load available models from MODELS_DIR
+    report_startup()
+    
+    # Backends are imported on first use; optionally warm them up in the background
+    preload = [name.strip() for name in os.getenv("PRELOAD_BACKENDS", "").split(",") if name.strip()]
+    preload_task = asyncio.create_task(preload_backends(preload)) if preload else None
     yield
+    if preload_task:
+        preload_task.cancel()
     logger.info("Shutting down Monolith backend...")
     # TODO: Cleanup and unload models
 
@@ -44,9 +58,10 @@ app.add_middleware(
 )
 
 # Include routers
-app.include_router(chat.router, prefix="/api/v1", tags=["chat"])
-app.include_router(models.router, prefix="/api/v1", tags=["models"])
-app.include_router(conversations.router, prefix="/api/v1", tags=["conversations"])
+with profile_step("include routers"):
+    app.include_router(chat.router, prefix="/api/v1", tags=["chat"])
+    app.include_router(models.router, prefix="/api/v1", tags=["models"])
+    app.include_router(conversations.router, prefix="/api/v1", tags=["conversations"])
 
 
 @app.get("/")
@@ -5,8 +5,7 @@ from pydantic import BaseModel, Field
 from typing import Optional
 import logging
 import json
-from app.llm.inference import generate_streaming
-from app.llm.ollama_inference import generate_streaming_ollama, check_ollama_available
+from app.llm.registry import resolve_backend, load_backend
 
 logger = logging.getLogger(__name__)
 
@@ -47,41 +46,27 @@ async def chat(request: ChatRequest):
     async def event_stream():
         """Generate SSE events."""
         try:
-            # Detect if this is an Ollama model
-            is_ollama = request.model.startswith("ollama:")
+            # Resolve the backend from the model ID prefix; its module is imported on first use
+            backend, model_name = resolve_backend(request.model)
+            module = load_backend(backend)
             
-            if is_ollama:
-                # Extract Ollama model name (remove "ollama:" prefix)
-                model_name = request.model.replace("ollama:", "")
-                
-                # Check if Ollama is available
-                if not await check_ollama_available():
-                    error_data = json.dumps({"error": "Ollama is not running. Please start Ollama."})
-                    yield f"data: {error_data}\n\n"
-                    return
-                
-                # Use Ollama inference
-                async for token in generate_streaming_ollama(
-                    model_name=model_name,
-                    messages=messages,
-                    temperature=request.temperature,
-                    max_tokens=request.max_tokens,
-                    top_p=request.top_p,
-                ):
-                    data = json.dumps({"token": token})
-                    logger.debug(f"Yielding token: {token}")
-                    yield f"data: {data}\n\n"
-            else:
-                # Use llama-cpp-python inference
-                async for token in generate_streaming(
-                    model_id=request.model,
-                    messages=messages,
-                    temperature=request.temperature,
-                    max_tokens=request.max_tokens,
-                    top_p=request.top_p,
-                ):
-                    data = json.dumps({"token": token})
-                    yield f"data: {data}\n\n"
+            # Check if the backend is available (e.g. Ollama is running)
+            if backend.check and not await getattr(module, backend.check)():
+                error_data = json.dumps({"error": backend.unavailable_message})
+                yield f"data: {error_data}\n\n"
+                return
+            
+            generate = getattr(module, backend.generate)
+            async for token in generate(
+                model_name,
+                messages=messages,
+                temperature=request.temperature,
+                max_tokens=request.max_tokens,
+                top_p=request.top_p,
+            ):
+                data = json.dumps({"token": token})
+                logger.debug(f"Yielding token: {token}")
+                yield f"data: {data}\n\n"
             
             # Send completion signal
             yield f"data: {json.dumps({'done': True})}\n\n"
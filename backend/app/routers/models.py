@@ -2,7 +2,7 @@
 from fastapi import APIRouter
 from pathlib import Path
 import os
-from app.llm.ollama_inference import list_ollama_models, check_ollama_available
+from app.llm.registry import get_backend, load_backend
 
 router = APIRouter()
 
@@ -42,11 +42,12 @@ def scan_models():
 async def scan_ollama_models():
     """Scan Ollama for available models."""
     models = []
+    ollama = load_backend(get_backend("ollama"))
     
-    if not await check_ollama_available():
+    if not await ollama.check_ollama_available():
         return models
     
-    ollama_models = await list_ollama_models()
+    ollama_models = await ollama.list_ollama_models()
     
     for model in ollama_models:
         model_name = model.get("name", "")
@@ -0,0 +1,151 @@
+"""Startup profiling - import and initialization time per step, plus a start-to-ready budget check.
+
+Set STARTUP_PROFILE=1 to log a per-step timing report once the app is ready.
+Run `python -m app.startup` to profile imports per module in a fresh interpreter
+and exit non-zero when importing app.main exceeds STARTUP_BUDGET_MS (run in CI).
+"""
+import logging
+import os
+import re
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Fallback reference point when the process start time is unavailable; app.main imports this module first
+STARTUP_BEGIN = time.perf_counter()
+
+DEFAULT_STARTUP_BUDGET_MS = 2000.0
+
+# Modules that must not be imported at startup; backends are loaded lazily by the backend registry
+LAZY_MODULES = ["llama_cpp", "app.llm.inference", "app.llm.ollama_inference"]
+
+
+def _parse_budget_ms(value: Optional[str]) -> float:
+    """Parse STARTUP_BUDGET_MS, falling back to the default on a bad value."""
+    if not value:
+        return DEFAULT_STARTUP_BUDGET_MS
+    try:
+        budget_ms = float(value)
+    except ValueError:
+        budget_ms = -1
+    if budget_ms <= 0:
+        logger.warning(f"Invalid STARTUP_BUDGET_MS={value!r}, using {DEFAULT_STARTUP_BUDGET_MS:.0f} ms")
+        return DEFAULT_STARTUP_BUDGET_MS
+    return budget_ms
+
+
+STARTUP_PROFILE = os.getenv("STARTUP_PROFILE", "").lower() in ("1", "true", "yes")
+STARTUP_BUDGET_MS = _parse_budget_ms(os.getenv("STARTUP_BUDGET_MS"))
+
+_timings: list[tuple[str, float]] = []
+
+
+@contextmanager
+def profile_step(name: str):
+    """Record how long a startup step (an import or an initialization) takes."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _timings.append((name, (time.perf_counter() - start) * 1000))
+
+
+def process_age_ms() -> Optional[float]:
+    """Time since the process started, from /proc (Linux only, so it covers the container entrypoint)."""
+    try:
+        with open("/proc/self/stat") as f:
+            stat = f.read()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        # Fields after the command name (which may contain spaces); starttime is field 22
+        start_ticks = int(stat.rsplit(")", 1)[1].split()[19])
+        return (uptime - start_ticks / os.sysconf("SC_CLK_TCK")) * 1000
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def report_startup() -> float:
+    """
+    Log the startup report and check it against the budget.
+
+    Returns:
+        Process start-to-ready time in milliseconds (app import-to-ready where /proc is unavailable)
+    """
+    total_ms = process_age_ms()
+    label = "process start to ready"
+    if total_ms is None:
+        total_ms = (time.perf_counter() - STARTUP_BEGIN) * 1000
+        label = "app import to ready"
+
+    if STARTUP_PROFILE:
+        logger.info("Startup profile:")
+        for name, elapsed_ms in _timings:
+            logger.info(f"  {elapsed_ms:8.1f} ms  {name}")
+        leaked = [name for name in LAZY_MODULES if name in sys.modules]
+        if leaked:
+            logger.warning(f"Lazy modules imported during startup: {', '.join(leaked)}")
+
+    if total_ms > STARTUP_BUDGET_MS:
+        logger.warning(f"Startup ({label}) took {total_ms:.1f} ms, over budget of {STARTUP_BUDGET_MS:.0f} ms")
+    else:
+        logger.info(f"Startup ({label}) took {total_ms:.1f} ms (budget {STARTUP_BUDGET_MS:.0f} ms)")
+    return total_ms
+
+
+def profile_imports(module: str = "app.main") -> list[tuple[str, float, float]]:
+    """
+    Import a module in a fresh interpreter with `-X importtime`.
+
+    Args:
+        module: Module to import
+
+    Returns:
+        List of (module name, self ms, cumulative ms) in import order
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to import {module}:\n{result.stderr}")
+
+    timings = []
+    pattern = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(.*)$")
+    for line in result.stderr.splitlines():
+        match = pattern.match(line)
+        if match:
+            self_us, cumulative_us, name = match.groups()
+            timings.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+    return timings
+
+
+def main(top: int = 20) -> int:
+    """Print the slowest imports of app.main and check them against the budget."""
+    timings = profile_imports("app.main")
+    # Only count app.main itself, not interpreter startup (site, encodings, ...)
+    total_ms = next(cumulative_ms for name, _, cumulative_ms in timings if name == "app.main")
+
+    print(f"{'self ms':>10} {'cumulative ms':>14}  module")
+    for name, self_ms, cumulative_ms in sorted(timings, key=lambda t: t[2], reverse=True)[:top]:
+        print(f"{self_ms:10.1f} {cumulative_ms:14.1f}  {name}")
+    print(f"\nImport time of app.main: {total_ms:.1f} ms (budget {STARTUP_BUDGET_MS:.0f} ms)")
+
+    failed = False
+    imported = {name for name, _, _ in timings}
+    leaked = [name for name in LAZY_MODULES if name in imported]
+    if leaked:
+        print(f"FAIL: lazy modules imported at startup: {', '.join(leaked)}")
+        failed = True
+    if total_ms > STARTUP_BUDGET_MS:
+        print("FAIL: import time over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
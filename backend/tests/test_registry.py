@@ -0,0 +1,45 @@
+"""Tests for the backend registry and lazy backend imports."""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.llm.registry import get_backend, resolve_backend
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def test_resolve_ollama_model_strips_prefix_only():
+    backend, model_name = resolve_backend("ollama:llama3.1:8b")
+    assert backend.name == "ollama"
+    assert model_name == "llama3.1:8b"
+
+
+def test_resolve_file_path_uses_llama_cpp():
+    backend, model_name = resolve_backend("small/x.gguf")
+    assert backend.name == "llama-cpp"
+    assert model_name == "small/x.gguf"
+
+
+def test_get_unknown_backend_raises():
+    with pytest.raises(KeyError):
+        get_backend("does-not-exist")
+
+
+def test_app_import_does_not_load_backends():
+    pytest.importorskip("fastapi")
+    lazy_modules = ["llama_cpp", "app.llm.inference", "app.llm.ollama_inference"]
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, app.main; "
+            f"print(','.join(m for m in {lazy_modules!r} if m in sys.modules))",
+        ],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""